@@ -4,110 +4,451 @@ Kursziel-Extraktor: Liest URLs aus Excel und extrahiert Kursziele von Webseiten
 Entspricht dem Power Query M-Code
 """
 
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import codecs
+import hashlib
+import io
+import logging
+import os
+import queue
 import re
-from typing import Optional, List, Dict
+import shutil
+import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Optional, List, Dict
+
+import pandas as pd
+import requests
+from openpyxl import load_workbook
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Caches liegen neben dem Skript, unabhängig vom aktuellen Arbeitsverzeichnis
+_CACHE_DIR = Path(__file__).resolve().parent / '.kursziel_cache'
+_CACHE_EXPIRE_SECONDS = 3600
+
+# Bereits extrahierte Tabellen je URL (Parquet), spart Download und Parsen
+_PARSED_CACHE_DIR = _CACHE_DIR / 'parsed'
+
+# Obergrenze für die Größe einer Seite (Kursziel-Seiten haben wenige hundert KB)
+_MAX_PAGE_BYTES = 2_000_000
 
-def get_kursziele_table(page_url: str) -> Optional[pd.DataFrame]:
+# Gemeinsame HTTP-Session, wird beim ersten Request angelegt
+_SESSION: Optional[CachedSession] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def declared_length(response: requests.Response) -> Optional[int]:
+    """Liefert den Content-Length-Header als Zahl oder None, wenn er fehlt"""
+    length = response.headers.get('Content-Length', '')
+    return int(length) if length.isdigit() else None
+
+
+def fits_page_limit(response: requests.Response) -> bool:
     """
-    Lädt eine Webseite und extrahiert die Kursziel-Tabelle.
+    Filter für den HTTP-Cache: nur Antworten mit angegebener Größe unterhalb
+    der Obergrenze speichern.
+    
+    requests-cache liest beim Speichern den kompletten Inhalt ein, noch bevor
+    read_body die Größe prüfen kann. Antworten ohne Content-Length werden daher
+    nicht gespeichert, sondern nur gestreamt gelesen.
     
     Args:
-        page_url: URL der Kursziel-Seite
+        response: Noch nicht gelesene HTTP-Antwort
         
     Returns:
-        DataFrame mit der Kursziel-Tabelle oder None
+        True, wenn die Antwort gespeichert werden darf
     """
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+    length = declared_length(response)
+    return length is not None and length <= _MAX_PAGE_BYTES
+
+
+def get_session() -> CachedSession:
+    """
+    Liefert die gemeinsame HTTP-Session und legt sie beim ersten Aufruf an.
+    
+    Keep-Alive-Verbindungen werden zwischen den Requests wiederverwendet, statt
+    pro URL neu aufgebaut zu werden. Antworten mit Content-Length bis zur
+    Größenobergrenze werden eine Stunde lokal (SQLite) zwischengespeichert, damit
+    wiederholte Läufe die Seiten nicht erneut herunterladen (siehe fits_page_limit).
+    Mit KURSZIEL_NOCACHE=1 werden beim Anlegen beide Caches geleert.
+    
+    Returns:
+        HTTP-Session mit Cache, Verbindungs-Pool und Retry
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            return _SESSION
+        
+        session = CachedSession(
+            str(_CACHE_DIR / 'http'),
+            backend='sqlite',
+            expire_after=_CACHE_EXPIRE_SECONDS,
+            allowable_codes=(200,),
+            cache_control=True,
+            filter_fn=fits_page_limit
+        )
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            # Bei 429/5xx mit exponentiellem Backoff wiederholen, Retry-After beachten
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            # Komprimierte Antworten anfordern (br benötigt das Paket "brotli")
+            'Accept-Encoding': 'gzip, deflate, br'
+        })
+        
+        # KURSZIEL_NOCACHE=1 erzwingt frische Daten
+        if os.environ.get('KURSZIEL_NOCACHE') == '1':
+            session.cache.clear()
+            shutil.rmtree(_PARSED_CACHE_DIR, ignore_errors=True)
+            logger.info("🗑️  Cache geleert")
+        
+        _SESSION = session
+        return _SESSION
+
+
+# URLs werden parallel verarbeitet; die Semaphore begrenzt die Zahl
+# gleichzeitiger Requests an den Server (beides pro Lauf einstellbar).
+MAX_WORKERS = 8
+MAX_REQUESTS = 4
+_REQUEST_SEMAPHORE = threading.Semaphore(MAX_REQUESTS)
+
+
+# Zeichensatz im Content-Type-Header, z. B. "text/html; charset=utf-8"
+_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Zeichensatz aus <meta charset="..."> bzw. <meta http-equiv ... content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Erste <table>, die vor ihrem schließenden Tag "kursziel" enthält
+_KURSZIEL_TABLE_RE = re.compile(
+    rb'<table[^>]*>(?:(?!</table>).)*?kursziel.*?</table>',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Währung, Leerzeichen und Tausenderpunkte in Kursziel-Texten
+_KURSZIEL_STRIP_RE = re.compile(r'€|EUR|USD|\s+|\.')
+
+
+def read_body(response: requests.Response) -> bytes:
+    """
+    Liest den Inhalt einer gestreamten Antwort bis zur Größenobergrenze.
+    
+    Args:
+        response: Mit stream=True abgerufene Antwort
+        
+    Returns:
+        Inhalt der Seite
+    """
+    # Zu große Seiten gar nicht erst lesen
+    length = declared_length(response)
+    if length is not None and length > _MAX_PAGE_BYTES:
+        raise ValueError(f"Seite zu groß ({length} > {_MAX_PAGE_BYTES} Bytes)")
+    
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(65536):
+        total += len(chunk)
+        if total > _MAX_PAGE_BYTES:
+            raise ValueError(f"Seite zu groß (> {_MAX_PAGE_BYTES} Bytes)")
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def declared_charset(response: requests.Response) -> Optional[str]:
+    """
+    Liefert den im Content-Type-Header angegebenen Zeichensatz.
+    
+    Anders als response.encoding wird für text/html ohne charset nicht
+    ISO-8859-1 angenommen, damit lxml den Zeichensatz aus <meta charset> erkennt.
+    
+    Args:
+        response: HTTP-Antwort
+        
+    Returns:
+        Zeichensatz oder None, wenn keiner angegeben ist
+    """
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+
+def parse_kursziel(values: pd.Series) -> pd.Series:
+    """
+    Wandelt Kursziel-Texte wie "1.234,50 €" in Zahlen um.
+    
+    Args:
+        values: Spalte mit Kursziel-Texten
         
-        response = requests.get(page_url, headers=headers, timeout=10)
-        response.raise_for_status()
+    Returns:
+        Spalte mit float-Werten (NaN, wenn nicht umwandelbar)
+    """
+    # Währung/Leerzeichen/Tausenderpunkte in einem Durchgang entfernen, Dezimalkomma -> Punkt
+    norm = (
+        values.astype(str)
+        .str.replace(_KURSZIEL_STRIP_RE, '', regex=True)
+        .str.replace(',', '.', regex=False)
+    )
+    return pd.to_numeric(norm, errors='coerce')
+
+
+def read_tables(html: bytes, encoding: Optional[str]) -> List[pd.DataFrame]:
+    """
+    Parst alle HTML-Tabellen eines Dokuments oder Ausschnitts.
+    
+    Args:
+        html: HTML-Inhalt
+        encoding: Zeichensatz laut Content-Type-Header (None: aus dem HTML erkennen)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+    Returns:
+        Liste der Tabellen (leer, wenn keine gefunden)
+    """
+    # Unbekannte Zeichensatz-Namen (z. B. "x-user-defined") lxml erkennen lassen
+    if encoding is not None:
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = None
+    
+    try:
+        return pd.read_html(io.BytesIO(html), flavor='lxml', encoding=encoding)
+    except ValueError:
+        return []
+
+
+def find_kursziel_table(dfs: List[pd.DataFrame], page_url: str) -> Optional[pd.DataFrame]:
+    """
+    Sucht die Tabelle mit "Kursziel" in den Spaltenüberschriften.
+    
+    Args:
+        dfs: Geparste Tabellen einer Seite
+        page_url: URL der Seite (für die Log-Ausgabe)
         
-        # Finde alle Tabellen
-        tables = soup.find_all('table')
+    Returns:
+        Kursziel-Tabelle mit numerischer Kursziel-Spalte oder None
+    """
+    for df in dfs:
+        # Finde Kursziel-Spalte (Spaltennamen nur einmal in Kleinbuchstaben umwandeln)
+        lower_map = {str(col).lower(): col for col in df.columns}
+        # Schnelle Ablehnung: eine Suche über alle Spaltennamen statt einer pro Spalte
+        if 'kursziel' not in '\x1f'.join(lower_map):
+            continue
+        # Trennzeichen kann nicht in "kursziel" vorkommen, also passt mindestens ein Name
+        match = next(lower_map[k] for k in lower_map if 'kursziel' in k)
         
-        if not tables:
-            print(f"  ⚠️  Keine Tabellen gefunden auf {page_url}")
-            return None
+        # Bereinige Spaltennamen
+        df.columns = [str(col).strip() for col in df.columns]
+        kursziel_col = str(match).strip()
         
-        # Suche nach Tabelle mit "Kursziel" in Spaltenüberschriften
-        for table in tables:
-            # Versuche Header zu finden
-            headers_row = table.find('thead')
-            if headers_row:
-                headers_text = [th.get_text(strip=True).lower() for th in headers_row.find_all(['th', 'td'])]
-            else:
-                # Erste Zeile als Header verwenden
-                first_row = table.find('tr')
-                if first_row:
-                    headers_text = [td.get_text(strip=True).lower() for td in first_row.find_all(['th', 'td'])]
-                else:
-                    continue
-            
-            # Prüfe ob "kursziel" in einem Header vorkommt
-            if any('kursziel' in h for h in headers_text):
-                # Extrahiere Tabelle als DataFrame
-                df = pd.read_html(str(table), flavor='bs4')[0]
-                
-                # Bereinige Spaltennamen
-                df.columns = [col.strip() for col in df.columns]
-                
-                # Finde Kursziel-Spalte
-                kursziel_col = None
-                for col in df.columns:
-                    if 'kursziel' in col.lower():
-                        kursziel_col = col
-                        break
-                
-                if kursziel_col:
-                    # Konvertiere Kursziel zu Zahl
-                    def parse_kursziel(value):
-                        if pd.isna(value):
-                            return None
-                        # Zu String konvertieren
-                        txt = str(value)
-                        # Währung/Leerzeichen entfernen
-                        stripped = txt.replace('€', '').replace('EUR', '').replace('USD', '').replace(' ', '')
-                        # Tausenderpunkte entfernen, Dezimalkomma -> Punkt
-                        norm = stripped.replace('.', '').replace(',', '.')
-                        try:
-                            return float(norm)
-                        except (ValueError, TypeError):
-                            return None
-                    
-                    df[kursziel_col] = df[kursziel_col].apply(parse_kursziel)
-                    print(f"  ✅ Kursziel-Tabelle gefunden: {len(df)} Zeilen, Spalte '{kursziel_col}'")
-                    return df
-        
-        # Falls keine passende Tabelle gefunden, nimm die erste
-        if tables:
-            try:
-                df = pd.read_html(str(tables[0]), flavor='bs4')[0]
-                df.columns = [col.strip() for col in df.columns]
-                print(f"  ⚠️  Erste Tabelle verwendet (keine Kursziel-Spalte gefunden): {len(df)} Zeilen")
-                return df
-            except Exception as e:
-                print(f"  ❌ Fehler beim Parsen der Tabelle: {e}")
+        # Konvertiere Kursziel zu Zahl
+        df[kursziel_col] = parse_kursziel(df[kursziel_col])
+        logger.info("  ✅ Kursziel-Tabelle gefunden auf %s: %s Zeilen, Spalte '%s'", page_url, len(df), kursziel_col)
+        return df
+    
+    return None
+
+
+def extract_kursziel_table(body: bytes, encoding: Optional[str], page_url: str) -> Optional[pd.DataFrame]:
+    """
+    Extrahiert die Kursziel-Tabelle aus dem HTML einer Seite.
+    
+    Args:
+        body: HTML-Inhalt der Seite
+        encoding: Zeichensatz laut Content-Type-Header (None: aus dem HTML erkennen)
+        page_url: URL der Seite (für die Log-Ausgabe)
         
+    Returns:
+        Kursziel-Tabelle, sonst die erste Tabelle der Seite oder None
+    """
+    # Ohne Angabe im Header den Zeichensatz aus <meta> übernehmen, da der
+    # ausgeschnittene Tabellen-Ausschnitt das <meta>-Tag nicht mehr enthält
+    if encoding is None:
+        meta = _META_CHARSET_RE.search(body, 0, 65536)
+        if meta:
+            encoding = meta.group(1).decode('ascii')
+    
+    # Schneller Weg: nur die erste Tabelle parsen, die "kursziel" enthält
+    has_kursziel = b'kursziel' in body.lower()
+    if has_kursziel:
+        match = _KURSZIEL_TABLE_RE.search(body)
+        if match:
+            df = find_kursziel_table(read_tables(match.group(0), encoding), page_url)
+            if df is not None:
+                return df
+    
+    # Alle Tabellen der Seite in einem Durchgang parsen
+    dfs = read_tables(body, encoding)
+    
+    if not dfs:
+        logger.warning("  ⚠️  Keine Tabellen gefunden auf %s", page_url)
         return None
+    
+    # Ohne "kursziel" auf der Seite kann keine Tabelle passen
+    if has_kursziel:
+        df = find_kursziel_table(dfs, page_url)
+        if df is not None:
+            return df
+    
+    # Falls keine passende Tabelle gefunden, nimm die erste
+    df = dfs[0]
+    df.columns = [str(col).strip() for col in df.columns]
+    logger.warning("  ⚠️  Erste Tabelle verwendet auf %s (keine Kursziel-Spalte gefunden): %s Zeilen", page_url, len(df))
+    return df
+
+
+def fetch_kursziele_table(page_url: str, request_slots: Optional[threading.Semaphore] = None) -> Optional[pd.DataFrame]:
+    """
+    Lädt eine Webseite und extrahiert die Kursziel-Tabelle.
+    
+    Args:
+        page_url: URL der Kursziel-Seite
+        request_slots: Begrenzt gleichzeitige Requests (Standard: MAX_REQUESTS)
+        
+    Returns:
+        DataFrame mit der Kursziel-Tabelle oder None
+    """
+    try:
+        with request_slots or _REQUEST_SEMAPHORE:
+            with get_session().get(page_url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                body = read_body(response)
+                encoding = declared_charset(response)
+        
+        return extract_kursziel_table(body, encoding, page_url)
         
     except requests.RequestException as e:
-        print(f"  ❌ HTTP-Fehler: {e}")
+        logger.error("  ❌ HTTP-Fehler bei %s: %s", page_url, e)
         return None
     except Exception as e:
-        print(f"  ❌ Fehler: {e}")
+        logger.error("  ❌ Fehler bei %s: %s", page_url, e)
         return None
 
 
-def process_kursziele_from_excel(excel_path: str, sheet_name: str = "Kursziele_Input", url_column: str = "Url") -> pd.DataFrame:
+def parsed_cache_path(page_url: str) -> Path:
+    """Pfad der zwischengespeicherten Tabelle für eine URL"""
+    key = hashlib.sha1(page_url.encode('utf-8')).hexdigest()
+    return _PARSED_CACHE_DIR / f'{key}.parquet'
+
+
+def get_kursziele_table(page_url: str, request_slots: Optional[threading.Semaphore] = None) -> Optional[pd.DataFrame]:
+    """
+    Liefert die Kursziel-Tabelle einer Seite, bevorzugt aus dem lokalen Cache.
+    
+    Args:
+        page_url: URL der Kursziel-Seite
+        request_slots: Begrenzt gleichzeitige Requests (Standard: MAX_REQUESTS)
+        
+    Returns:
+        DataFrame mit der Kursziel-Tabelle oder None
+    """
+    # Session zuerst anlegen, damit KURSZIEL_NOCACHE=1 auch den Tabellen-Cache leert
+    get_session()
+    
+    cache_path = parsed_cache_path(page_url)
+    try:
+        if cache_path.stat().st_mtime > time.time() - _CACHE_EXPIRE_SECONDS:
+            df = pd.read_parquet(cache_path)
+            logger.info("  ✅ Kursziel-Tabelle aus Cache für %s: %s Zeilen", page_url, len(df))
+            return df
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("  ⚠️  Cache nicht lesbar für %s: %s", page_url, e)
+    
+    df = fetch_kursziele_table(page_url, request_slots)
+    
+    if df is not None:
+        # Über eine eindeutige temporäre Datei schreiben, damit parallele Threads
+        # und Prozesse keine halben Dateien lesen oder veröffentlichen
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_path.parent, prefix=f'{cache_path.stem}.',
+                                             suffix='.tmp', delete=False) as tmp:
+                tmp_path = Path(tmp.name)
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            logger.warning("  ⚠️  Tabelle nicht im Cache gespeichert für %s: %s", page_url, e)
+    
+    return df
+
+
+def read_excel_sheet(excel_path: str, sheet_name: str) -> pd.DataFrame:
+    """
+    Liest ein Arbeitsblatt im Read-only-Modus (zeilenweise, ohne Formatierungen).
+    
+    Args:
+        excel_path: Pfad zur Excel-Datei
+        sheet_name: Name des Arbeitsblatts
+        
+    Returns:
+        DataFrame mit der ersten Zeile als Spaltenüberschriften
+    """
+    wb = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        rows = wb[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        
+        # Leere und doppelte Überschriften wie pd.read_excel benennen ("Unnamed: 2", "WKN.1")
+        columns = []
+        seen = {}
+        for i, name in enumerate(header):
+            if name is None or str(name).strip() == '':
+                name = f'Unnamed: {i}'
+            if name in seen:
+                seen[name] += 1
+                name = f'{name}.{seen[name]}'
+            else:
+                seen[name] = 0
+            columns.append(name)
+        
+        return pd.DataFrame(rows, columns=columns)
+    finally:
+        wb.close()
+
+
+def combine_results(results: List[pd.DataFrame], meta_rows: List[Dict]) -> pd.DataFrame:
+    """
+    Hängt die extrahierten Tabellen aneinander und ergänzt je Zeile die Metadaten.
+    
+    Args:
+        results: Extrahierte Tabellen (nicht leer)
+        meta_rows: Metadaten je Tabelle (Source_URL und ursprüngliche Spalten)
+        
+    Returns:
+        Zusammengeführter DataFrame; gleichnamige Tabellenspalten werden durch die Metadaten ersetzt
+    """
+    # Metadaten einmal pro Tabellenzeile wiederholen und spaltenweise anhängen
+    meta = pd.DataFrame(meta_rows)
+    meta = meta.loc[meta.index.repeat([len(t) for t in results])].reset_index(drop=True)
+    final_df = pd.concat(results, ignore_index=True)
+    return pd.concat([final_df.drop(columns=meta.columns, errors='ignore'), meta], axis=1)
+
+
+def process_kursziele_from_excel(excel_path: str, sheet_name: str = "Kursziele_Input", url_column: str = "Url",
+                                 max_workers: int = MAX_WORKERS, max_requests: int = MAX_REQUESTS) -> pd.DataFrame:
     """
     Liest URLs aus Excel und extrahiert Kursziele von den Webseiten.
     
@@ -115,86 +456,133 @@ def process_kursziele_from_excel(excel_path: str, sheet_name: str = "Kursziele_I
         excel_path: Pfad zur Excel-Datei
         sheet_name: Name des Arbeitsblatts (Standard: "Kursziele_Input")
         url_column: Name der Spalte mit URLs (Standard: "Url")
+        max_workers: Anzahl paralleler Worker-Threads (Standard: MAX_WORKERS)
+        max_requests: Höchstzahl gleichzeitiger Requests an den Server (Standard: MAX_REQUESTS)
         
     Returns:
         DataFrame mit allen extrahierten Daten
     """
-    print(f"📖 Lese Excel-Datei: {excel_path}")
+    logger.info("📖 Lese Excel-Datei: %s", excel_path)
     
     try:
         # Lese Excel
-        df = pd.read_excel(excel_path, sheet_name=sheet_name)
-        print(f"✅ {len(df)} Zeilen gelesen")
+        df = read_excel_sheet(excel_path, sheet_name)
+        logger.info("✅ %s Zeilen gelesen", len(df))
         
         # Bereinige URLs (entferne leere/null Werte)
         df = df[df[url_column].notna()]
         df[url_column] = df[url_column].astype(str).str.strip()
         df = df[df[url_column] != '']
         
-        print(f"✅ {len(df)} URLs nach Bereinigung")
+        logger.info("✅ %s URLs nach Bereinigung", len(df))
         
-        # Extrahiere Kursziele für jede URL
-        results = []
-        for idx, row in df.iterrows():
-            url = row[url_column]
-            print(f"\n🔍 Verarbeite URL {idx+1}/{len(df)}: {url}")
-            
-            kursziel_table = get_kursziele_table(url)
+        # Extrahiere Kursziele für jede URL (parallel)
+        urls = df[url_column].tolist()
+        # Ohne weitere Spalten liefert to_dict('records') eine leere Liste
+        extras = df.drop(columns=[url_column]).to_dict('records') or [{} for _ in urls]
+        tables = [None] * len(urls)
+        request_slots = threading.Semaphore(max_requests)
+        
+        def process_url(pos: int, url: str) -> Optional[pd.DataFrame]:
+            # Meldung erst beim Start im Worker, nicht schon beim Einreihen
+            logger.info("\n🔍 Verarbeite URL %s/%s: %s", pos+1, len(urls), url)
+            return get_kursziele_table(url, request_slots)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for pos, url in enumerate(urls):
+                futures[executor.submit(process_url, pos, url)] = pos
             
+            for future in as_completed(futures):
+                tables[futures[future]] = future.result()
+        
+        # Ergebnisse in der Reihenfolge der Excel-Zeilen übernehmen
+        results = []
+        meta_rows = []
+        for url, extra, kursziel_table in zip(urls, extras, tables, strict=True):
             if kursziel_table is not None and len(kursziel_table) > 0:
-                # Füge URL als Spalte hinzu
-                kursziel_table['Source_URL'] = url
-                # Füge alle ursprünglichen Spalten hinzu
-                for col in df.columns:
-                    if col != url_column:
-                        kursziel_table[col] = row[col]
-                
                 results.append(kursziel_table)
-                time.sleep(1)  # Pause zwischen Requests
+                # URL und alle ursprünglichen Spalten als Metadaten merken
+                meta_rows.append({'Source_URL': url, **extra})
             else:
-                print(f"  ⚠️  Keine Daten extrahiert")
+                logger.warning("  ⚠️  Keine Daten extrahiert: %s", url)
         
         # Zusammenführen aller Ergebnisse
         if results:
-            final_df = pd.concat(results, ignore_index=True)
-            print(f"\n✅ Insgesamt {len(final_df)} Zeilen extrahiert")
+            final_df = combine_results(results, meta_rows)
+            logger.info("\n✅ Insgesamt %s Zeilen extrahiert", len(final_df))
             return final_df
         else:
-            print("\n⚠️  Keine Daten extrahiert")
+            logger.warning("\n⚠️  Keine Daten extrahiert")
             return pd.DataFrame()
             
     except FileNotFoundError:
-        print(f"❌ Datei nicht gefunden: {excel_path}")
+        logger.error("❌ Datei nicht gefunden: %s", excel_path)
         return pd.DataFrame()
     except Exception as e:
-        print(f"❌ Fehler: {e}")
+        logger.error("❌ Fehler: %s", e)
         return pd.DataFrame()
 
 
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler, der Log-Einträge unformatiert in die Queue legt.
+    
+    QueueHandler.prepare() formatiert die Meldung schon im aufrufenden Thread;
+    hier übernimmt das der Listener-Thread. Das ist möglich, weil die Queue im
+    selben Prozess bleibt und die Einträge nicht serialisiert werden müssen.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging() -> QueueListener:
+    """
+    Leitet Log-Ausgaben über eine Queue an einen eigenen Ausgabe-Thread,
+    damit die Worker-Threads nicht auf stdout warten.
+    
+    Returns:
+        Gestarteter QueueListener (am Ende mit stop() beenden)
+    """
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(log_queue, handler)
+    
+    root = logging.getLogger()
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+
 def main():
     """Hauptfunktion - Beispiel-Nutzung"""
-    import sys
-    
     if len(sys.argv) > 1:
         excel_path = sys.argv[1]
     else:
         excel_path = input("Pfad zur Excel-Datei: ").strip()
     
-    if not excel_path:
-        print("❌ Kein Pfad angegeben")
-        return
-    
-    result = process_kursziele_from_excel(excel_path)
-    
-    if not result.empty:
-        # Speichere Ergebnis
-        output_path = excel_path.replace('.xlsx', '_kursziele.xlsx').replace('.xls', '_kursziele.xlsx')
-        result.to_excel(output_path, index=False)
-        print(f"\n💾 Ergebnis gespeichert: {output_path}")
-        print(f"\n📊 Übersicht:")
-        print(result.head(10))
-    else:
-        print("\n❌ Keine Daten zum Speichern")
+    listener = setup_logging()
+    try:
+        if not excel_path:
+            logger.error("❌ Kein Pfad angegeben")
+            return
+        
+        result = process_kursziele_from_excel(excel_path)
+        
+        if not result.empty:
+            # Speichere Ergebnis
+            output_path = excel_path.replace('.xlsx', '_kursziele.xlsx')
+            result.to_excel(output_path, index=False, engine='xlsxwriter')
+            logger.info("\n💾 Ergebnis gespeichert: %s", output_path)
+            logger.info("\n📊 Übersicht:")
+            logger.info("%s", result.head(10))
+        else:
+            logger.error("\n❌ Keine Daten zum Speichern")
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
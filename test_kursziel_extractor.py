@@ -3,10 +3,14 @@
 
 import sys
 import os
+import logging
 
 # Füge aktuelles Verzeichnis zum Python-Pfad hinzu
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Meldungen des Extraktors auf der Konsole anzeigen
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
 try:
     from kursziel_extractor import get_kursziele_table
     print("✅ Modul importiert")
@@ -40,7 +44,7 @@ try:
 except ImportError as e:
     print(f"❌ Import-Fehler: {e}")
     print("\nBitte installieren Sie die Abhängigkeiten:")
-    print("pip3 install pandas openpyxl requests beautifulsoup4 lxml html5lib")
+    print("pip3 install pandas openpyxl xlsxwriter pyarrow requests requests-cache brotli lxml")
     sys.exit(1)
 except Exception as e:
     print(f"❌ Fehler: {e}")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Offline-Tests für das Parsen im Kursziel-Extraktor (ohne Netzwerk)"""
+
+import sys
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+from openpyxl import Workbook
+
+# Füge aktuelles Verzeichnis zum Python-Pfad hinzu
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from kursziel_extractor import (
+    _KURSZIEL_TABLE_RE,
+    combine_results,
+    extract_kursziel_table,
+    find_kursziel_table,
+    parse_kursziel,
+    process_kursziele_from_excel,
+    read_tables,
+)
+
+TEST_URL = "https://www.finanzen.net/kursziele/test"
+
+SEITE_MIT_KURSZIEL = """<html><head><meta charset="utf-8"></head><body>
+<table id="kurse"><tr><th>Börse</th><th>Kurs</th></tr><tr><td>Xetra</td><td>100,00</td></tr></table>
+<table id="analysten">
+  <thead><tr><th>Analyst</th><th>Kursziel</th><th>Datum</th></tr></thead>
+  <tbody>
+    <tr><td>Müller Bank</td><td>1.234,50 €</td><td>01.02.2024</td></tr>
+    <tr><td>Beispiel AG</td><td>n/a</td><td>02.02.2024</td></tr>
+  </tbody>
+</table>
+</body></html>""".encode('utf-8')
+
+SEITE_OHNE_KURSZIEL = """<html><head><meta charset="utf-8"></head><body>
+<table><tr><th> Börse </th><th>Kurs</th></tr><tr><td>Xetra</td><td>100,00</td></tr></table>
+<table><tr><th>Name</th></tr><tr><td>Test</td></tr></table>
+</body></html>""".encode('utf-8')
+
+
+class ParseKurszielTest(unittest.TestCase):
+    """Umwandlung von Kursziel-Texten in Zahlen"""
+
+    def test_deutsches_zahlenformat_mit_waehrung(self):
+        result = parse_kursziel(pd.Series(["1.234,50 €"]))
+        self.assertEqual(result.iloc[0], 1234.5)
+
+    def test_waehrungskuerzel_und_leerzeichen(self):
+        result = parse_kursziel(pd.Series(["85,00 EUR", "1\xa0000 USD"]))
+        self.assertEqual(result.tolist(), [85.0, 1000.0])
+
+    def test_nicht_umwandelbar_wird_nan(self):
+        result = parse_kursziel(pd.Series(["n/a", None]))
+        self.assertTrue(result.isna().all())
+
+
+class TabellenauswahlTest(unittest.TestCase):
+    """Auswahl der Kursziel-Tabelle aus dem HTML"""
+
+    def test_regex_schneidet_nur_kursziel_tabelle_aus(self):
+        match = _KURSZIEL_TABLE_RE.search(SEITE_MIT_KURSZIEL)
+        self.assertIsNotNone(match)
+        fragment = match.group(0)
+        self.assertTrue(fragment.startswith(b'<table id="analysten">'))
+        self.assertNotIn(b'Xetra', fragment)
+
+        df = find_kursziel_table(read_tables(fragment, 'utf-8'), TEST_URL)
+        self.assertIsNotNone(df)
+        self.assertEqual(list(df.columns), ['Analyst', 'Kursziel', 'Datum'])
+        self.assertEqual(df['Analyst'].iloc[0], 'Müller Bank')
+        self.assertEqual(df['Kursziel'].iloc[0], 1234.5)
+        self.assertTrue(pd.isna(df['Kursziel'].iloc[1]))
+
+    def test_ganze_seite_liefert_kursziel_tabelle(self):
+        df = extract_kursziel_table(SEITE_MIT_KURSZIEL, None, TEST_URL)
+        self.assertEqual(list(df.columns), ['Analyst', 'Kursziel', 'Datum'])
+        self.assertEqual(len(df), 2)
+        # Zeichensatz aus <meta> gilt auch für den ausgeschnittenen Ausschnitt
+        self.assertEqual(df['Analyst'].iloc[0], 'Müller Bank')
+        self.assertEqual(df['Kursziel'].iloc[0], 1234.5)
+
+    def test_ohne_kursziel_spalte_wird_erste_tabelle_verwendet(self):
+        self.assertIsNone(find_kursziel_table(read_tables(SEITE_OHNE_KURSZIEL, None), TEST_URL))
+
+        df = extract_kursziel_table(SEITE_OHNE_KURSZIEL, None, TEST_URL)
+        self.assertEqual(list(df.columns), ['Börse', 'Kurs'])
+        self.assertEqual(df['Börse'].iloc[0], 'Xetra')
+
+    def test_unbekannter_zeichensatz_wird_ignoriert(self):
+        seite = SEITE_MIT_KURSZIEL.replace(b'charset="utf-8"', b'charset="x-user-defined"')
+        df = extract_kursziel_table(seite, None, TEST_URL)
+        self.assertIsNotNone(df)
+        self.assertEqual(list(df.columns), ['Analyst', 'Kursziel', 'Datum'])
+        self.assertEqual(len(df), 2)
+
+        # Gleicher Weg für einen unbekannten Zeichensatz aus dem Content-Type-Header
+        self.assertEqual(len(read_tables(SEITE_OHNE_KURSZIEL, 'utf-8-tippfehler')), 2)
+
+    def test_ohne_tabellen_none(self):
+        self.assertIsNone(extract_kursziel_table(b'<html><body><p>Kursziel</p></body></html>', None, TEST_URL))
+
+
+class CombineResultsTest(unittest.TestCase):
+    """Zusammenführen der Tabellen mit den Metadaten"""
+
+    def test_metadaten_je_zeile_wiederholt(self):
+        results = [
+            pd.DataFrame({'Kursziel': [1.0, 2.0]}),
+            pd.DataFrame({'Kursziel': [3.0]}),
+        ]
+        meta_rows = [
+            {'Source_URL': 'https://a', 'WKN': '1'},
+            {'Source_URL': 'https://b', 'WKN': '2'},
+        ]
+        df = combine_results(results, meta_rows)
+        self.assertEqual(list(df.columns), ['Kursziel', 'Source_URL', 'WKN'])
+        self.assertEqual(df['Kursziel'].tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(df['Source_URL'].tolist(), ['https://a', 'https://a', 'https://b'])
+        self.assertEqual(df['WKN'].tolist(), ['1', '1', '2'])
+
+    def test_metadaten_ersetzen_gleichnamige_tabellenspalten(self):
+        results = [pd.DataFrame({'Kursziel': [1.0, 2.0], 'WKN': ['alt', 'alt']})]
+        meta_rows = [{'Source_URL': 'https://a', 'WKN': '703000'}]
+        df = combine_results(results, meta_rows)
+        self.assertEqual(list(df.columns), ['Kursziel', 'Source_URL', 'WKN'])
+        self.assertEqual(df['WKN'].tolist(), ['703000', '703000'])
+
+
+
+class ProcessExcelTest(unittest.TestCase):
+    """Verarbeitung der Excel-Eingabe (Abruf der Seiten ersetzt)"""
+
+    def test_nur_url_spalte(self):
+        # Minimales Layout laut README: nur die Spalte "Url"
+        with tempfile.TemporaryDirectory() as tmp:
+            excel_path = os.path.join(tmp, 'Kursziele_Input.xlsx')
+            wb = Workbook()
+            ws = wb.active
+            ws.title = 'Kursziele_Input'
+            ws.append(['Url'])
+            ws.append(['https://a'])
+            ws.append(['https://b'])
+            wb.save(excel_path)
+
+            tabelle = pd.DataFrame({'Kursziel': [1.0]})
+            with mock.patch('kursziel_extractor.get_kursziele_table', return_value=tabelle) as fetch:
+                df = process_kursziele_from_excel(excel_path)
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(list(df.columns), ['Kursziel', 'Source_URL'])
+        self.assertEqual(df['Source_URL'].tolist(), ['https://a', 'https://b'])
+
+
+if __name__ == "__main__":
+    unittest.main()